@@ -14,6 +14,10 @@ Notes:
 - Output filenames drop the "_rebuilt" suffix, e.g., "foo_rebuilt.blif" -> "foo.aig".
 """
 
+import collections
+import concurrent.futures
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -27,13 +31,22 @@ def quote_for_abc(path: Path) -> str:
 
 def ensure_abc_in_path() -> None:
     """Fail fast if ABC is not available."""
-    result = subprocess.run(["which", "abc"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if result.returncode != 0:
+    if shutil.which("abc") is None:
         sys.exit("Error: 'abc' binary not found in PATH. Install ABC or adjust PATH before running.")
 
 
+BATCH_SIZE = 50
+
+
+def is_up_to_date(blif_path: Path, out_path: Path) -> bool:
+    """True when the AIG already exists and is at least as new as the BLIF."""
+    return out_path.exists() and out_path.stat().st_mtime >= blif_path.stat().st_mtime
+
+
 def convert_blif_to_aig(blif_path: Path, out_path: Path) -> None:
     """Invoke ABC to read BLIF and write AIG."""
+    if is_up_to_date(blif_path, out_path):
+        return
     out_path.parent.mkdir(parents=True, exist_ok=True)
     cmd = ["abc", "-c", f"read_blif {quote_for_abc(blif_path)}; strash; write_aiger {quote_for_abc(out_path)}"]
     result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
@@ -44,6 +57,55 @@ def convert_blif_to_aig(blif_path: Path, out_path: Path) -> None:
         raise RuntimeError(f"ABC reported success but did not create '{out_path}'. Output:\n{result.stdout}")
 
 
+def convert_blif_batch(pairs: list[tuple[Path, Path]]) -> list[tuple[Path, str]]:
+    """Convert several BLIF files with a single ABC invocation.
+
+    Batching amortizes process startup and ABC's own init over the whole
+    chunk. Returns (blif_path, error message) tuples for files whose AIG
+    was not produced.
+    """
+    # Unchanged inputs with a fresh AIG need no ABC invocation at all.
+    pairs = [(blif_path, out_path) for blif_path, out_path in pairs
+             if not is_up_to_date(blif_path, out_path)]
+    if not pairs:
+        return []
+    commands = []
+    for blif_path, out_path in pairs:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        commands.append(
+            f"read_blif {quote_for_abc(blif_path)}; strash; write_aiger {quote_for_abc(out_path)}"
+        )
+    cmd = ["abc", "-c", "; ".join(commands)]
+    subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+    # ABC aborts the rest of a "-c" command chain on the first failing
+    # command, so a missing output does not identify the culprit — every
+    # file after the bad one is missing too. Retry those files one at a
+    # time so only the conversions that genuinely fail get reported.
+    failures = []
+    for blif_path, out_path in pairs:
+        if out_path.exists():
+            continue
+        try:
+            convert_blif_to_aig(blif_path, out_path)
+        except RuntimeError as exc:
+            failures.append((blif_path, str(exc)))
+    return failures
+
+
+def iter_rebuilt_blifs(root: Path):
+    """Recursively yield *_rebuilt.blif paths using os.scandir.
+
+    scandir exposes the kernel-provided d_type, so the walk avoids the
+    per-entry stat that Path.rglob pays on large benchmark trees.
+    """
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_rebuilt_blifs(Path(entry.path))
+        elif entry.name.endswith("_rebuilt.blif"):
+            yield Path(entry.path)
+
+
 def main(argv: list[str]) -> None:
     if len(argv) < 2 or len(argv) > 3:
         sys.exit(__doc__)
@@ -56,23 +118,61 @@ def main(argv: list[str]) -> None:
 
     ensure_abc_in_path()
 
-    blif_files = sorted(input_dir.rglob("*_rebuilt.blif"))
+    blif_files = sorted(iter_rebuilt_blifs(input_dir))
     if not blif_files:
         sys.exit(f"No *_rebuilt.blif files found under '{input_dir}'.")
 
     print(f"[i] Converting {len(blif_files)} BLIF file(s) from '{input_dir}' to '{output_dir}'")
     failures: list[str] = []
 
+    pairs = []
     for blif_file in blif_files:
         relative = blif_file.relative_to(input_dir)
         stem_without_rebuilt = relative.stem.replace("_rebuilt", "", 1)
         out_file = output_dir / relative.with_name(f"{stem_without_rebuilt}.aig")
-        try:
-            convert_blif_to_aig(blif_file, out_file)
-            print(f"[ok] {relative} -> {out_file.relative_to(output_dir)}")
-        except Exception as exc:  # noqa: BLE001
-            failures.append(f"{relative}: {exc}")
-            print(f"[fail] {relative}: {exc}")
+        pairs.append((blif_file, out_file))
+
+    # Chunk the files so each ABC invocation handles many conversions, then
+    # fan the chunks out over a process pool and collect results as they
+    # finish.
+    chunks = [pairs[i:i + BATCH_SIZE] for i in range(0, len(pairs), BATCH_SIZE)]
+    # Buffer status lines and flush in batches so progress reporting does
+    # one write syscall per ~32 files instead of one per file.
+    pending_lines = collections.deque()
+
+    def flush_lines() -> None:
+        if pending_lines:
+            sys.stdout.write("".join(pending_lines))
+            sys.stdout.flush()
+            pending_lines.clear()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        future_to_chunk = {
+            executor.submit(convert_blif_batch, chunk): chunk for chunk in chunks
+        }
+
+        for future in concurrent.futures.as_completed(future_to_chunk):
+            chunk = future_to_chunk[future]
+            try:
+                chunk_failures = future.result()
+            except Exception as exc:  # noqa: BLE001
+                chunk_failures = [(blif_file, str(exc)) for blif_file, _ in chunk]
+            failed_files = {blif_file for blif_file, _ in chunk_failures}
+            for blif_file, out_file in chunk:
+                relative = blif_file.relative_to(input_dir)
+                if blif_file in failed_files:
+                    continue
+                pending_lines.append(f"[ok] {relative} -> {out_file.relative_to(output_dir)}\n")
+                if len(pending_lines) >= 32:
+                    flush_lines()
+            for blif_file, message in chunk_failures:
+                relative = blif_file.relative_to(input_dir)
+                failures.append(f"{relative}: {message}")
+                pending_lines.append(f"[fail] {relative}: {message}\n")
+                if len(pending_lines) >= 32:
+                    flush_lines()
+
+    flush_lines()
 
     if failures:
         sys.exit(f"Completed with {len(failures)} failure(s):\n" + "\n".join(failures))
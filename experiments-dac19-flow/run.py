@@ -1,6 +1,10 @@
+import concurrent.futures
 import csv
+import functools
 import json
 import inspect
+import operator
+import sys
 import cirkit
 import subprocess
 from pathlib import Path
@@ -10,6 +14,7 @@ ROOT = Path(__file__).resolve().parent
 ### Global settings
 verbose = True
 print_progress = True
+parallel_jobs = 1  # set > 1 to spread (benchmark, configuration) pairs over worker processes
 
 ### Misc
 class color:
@@ -81,7 +86,31 @@ for _conf_name in list(configurations.keys()):
       unsupported_configurations.add(_conf_name)
       print(f"[w] configuration '{_conf_name}' not supported by cirkit: {exc}")
 
+# The supported-store set is fixed after detection (barring late failures),
+# so build the clear-everything kwargs once instead of per clear_store call.
+_CLEAR_ALL_KWARGS = {}
+
+def _rebuild_clear_kwargs():
+   _CLEAR_ALL_KWARGS.clear()
+   _CLEAR_ALL_KWARGS['clear'] = True
+   for store in supported_stores:
+      _CLEAR_ALL_KWARGS[store] = True
+
+_rebuild_clear_kwargs()
+
+# The store-selection kwargs ({name: True}) are tiny but get rebuilt on
+# every wrapper call in the flow's hot loop; cache one dict per name.
+_NAME_KW = {n: {n: True} for n in configurations}
+_NAME_KW['lut'] = {'lut': True}
+
+def _name_kw(name):
+   kw = _NAME_KW.get(name)
+   if kw is None:
+      kw = _NAME_KW[name] = {name: True}
+   return kw
+
 ### Cirkit wrapper calls
+@functools.lru_cache(maxsize=None)
 def aigerfile(name):
    path = ROOT / "benchmarks" / f"{name}.aig"
    if not path.exists():
@@ -94,41 +123,42 @@ def resultfile(name, suffix, ext):
    return result_path
 
 def read(name,filename):
-   return cirkit.read_aiger(filename=str(filename), **{name : True})
+   return cirkit.read_aiger(filename=str(filename), **_name_kw(name))
 
 def write(name,filename):
-   cirkit.write_verilog(filename=str(filename), **{name : True})
+   cirkit.write_verilog(filename=str(filename), **_name_kw(name))
 
-def clear_store():
+def clear_store(*names):
+   """Clear the given stores, or every supported store when none are given."""
+   if not names:
+      cirkit.store(**_CLEAR_ALL_KWARGS)
+      return
    store_kwargs = {'clear': True}
-   for store in supported_stores:
-      store_kwargs[store] = True
+   for store in names:
+      if store in supported_stores:
+         store_kwargs[store] = True
    cirkit.store(**store_kwargs)
 
 def ps(name):
-   return cirkit.ps(silent=True, **{name : True})
+   return cirkit.ps(silent=True, **_name_kw(name))
 
 def lut_mapping(name):
-   return cirkit.lut_mapping(**{name : True})
+   return cirkit.lut_mapping(**_name_kw(name))
 
 def collapse_mapping(name):
-   return cirkit.collapse_mapping(**{name : True})
+   return cirkit.collapse_mapping(**_name_kw(name))
 
-def compute_stats(name):
+def compute_ntk_stats(name):
+   """Cheap statistics that leave the loaded network untouched."""
    ntk_stats = ps(name).dict()
-   cost_stats = cirkit.migcost(**{name : True}).dict()
-   lut_mapping(name)
-   collapse_mapping(name)
-   lut_stats = ps('lut').dict()
+   cost_stats = cirkit.migcost(**_name_kw(name)).dict()
 
-   statistics = {
+   return {
       'pis': ntk_stats['pis'],
       'pos': ntk_stats['pos'],
       'gates' : ntk_stats['gates'],
       'depth': ntk_stats['depth'],
       'inverters': cost_stats.get('num_inverters'),
-      'luts' : lut_stats['gates'],
-      'lut_depth' : lut_stats.get('depth'),
       'qca_area': cost_stats.get('qca_area'),
       'qca_delay': cost_stats.get('qca_delay'),
       'qca_energy': cost_stats.get('qca_energy'),
@@ -137,8 +167,23 @@ def compute_stats(name):
       'stmg_energy': cost_stats.get('stmg_energy'),
    }
 
+def compute_lut_stats(name):
+   """LUT mapping statistics; overwrites the 'lut' store."""
+   lut_mapping(name)
+   collapse_mapping(name)
+   lut_stats = ps('lut').dict()
+
+   return {
+      'luts' : lut_stats['gates'],
+      'lut_depth' : lut_stats.get('depth'),
+   }
+
+def compute_stats(name):
+   statistics = compute_ntk_stats(name)
+   statistics.update(compute_lut_stats(name))
    return statistics
 
+
 def rfz(name):
    if ( name == 'mig' ):
       return cirkit.refactor(strategy=1, progress=True, zero_gain=True)
@@ -191,9 +236,11 @@ def bz(name):
 
 def abc_cec(in_filename, out_filename, log_filename="abc.log"):
    cmd = ["abc", "-c", f"cec -n {in_filename} {out_filename}"]
-   res = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-   Path(log_filename).write_text(res.stdout)
-   return res.stdout
+   # Let ABC write straight into the log file instead of buffering the
+   # whole output in a Python string and writing it out a second time.
+   with open(log_filename, "w") as logfile:
+      subprocess.run(cmd, stdout=logfile, stderr=subprocess.STDOUT)
+   return Path(log_filename).read_text()
 
 ### Optimization script
 compress2rs = [
@@ -217,17 +264,22 @@ compress2rs = [
     [bz, {}],
 ]
 
-def run_flow(flow_script, verbose = False):
-    time_total = 0.0
-    for transformation in flow_script:
-        functor = transformation[0]
-        args = transformation[1]
+# Pre-bind the step arguments once so the flow loop is a flat call per
+# step instead of re-unpacking the kwargs dict every iteration. The name
+# and args are kept only for logging.
+compress2rs_bound = [
+    (functools.partial(transformation[0], **transformation[1]), transformation[0].__name__, transformation[1])
+    for transformation in compress2rs
+]
 
-        stats = functor(name, **args)
+def run_flow(flow_script, name, verbose = False):
+    time_total = 0.0
+    for call, fname, args in flow_script:
+        stats = call(name)
         time = stats['time_total']
 
         if (verbose):
-            print("[i] ", functor.__name__, args, 'time: %8.2fs' % time)
+            print("[i] ", fname, args, 'time: %8.2fs' % time)
         time_total = time_total + time
 
     statistics = {
@@ -235,127 +287,8 @@ def run_flow(flow_script, verbose = False):
     }
     return statistics
 
-table = {}
-
-# table = {
-#     'adder' :
-#     {
-#         'baseline': { 'gates': gates, 'depth': depth, 'luts': luts, 'time': time },
-#         'aig': { ... } ,
-#         'mig': { ... },
-#         'xag': { ... },
-#         'xmg': { ... },
-#     }
-#     ...
-# }
-
-for benchmark, benchmark_params in benchmarks.items():
-   for name, configuration in configurations.items():
-      if name in unsupported_configurations:
-         print(f"[w] skipping {benchmark} with {name}: configuration not supported")
-         continue
-      try:
-         print(f"[i] run {benchmark} with {name}")
-
-         # read benchmark
-         in_filename = aigerfile(benchmark)
-         read(name, in_filename)
-
-         # compute statistics for initial benchmark
-         stats_before = compute_stats(name)
-
-         # clear storage and re-read benchmark
-         clear_store()
-         read(name, in_filename)
-
-         # run flow script
-         stats_opt = run_flow(compress2rs, verbose)
-
-         # compute statistics for optimized benchmark
-         stats_after = compute_stats(name)
-
-         # write result file
-         out_filename = resultfile(benchmark, name, 'v')
-         write(name, out_filename)
-
-         # verify final result using ABC CEC
-         verified = color.BLUE + '[not checked]' + color.ENDC
-         if benchmark_params['verify']:
-            output = abc_cec(in_filename, out_filename, log_filename="abc.log")
-            if "Networks are equivalent" in output:
-               verified = color.GREEN + '[verified]' + color.ENDC
-            else:
-               print('[e] verification after optimization failed')
-               verified = color.RED + '[failed]' + color.ENDC
-
-         # update table
-         if (not benchmark in table):
-            table[benchmark] = {
-               'baseline': {
-                  'pis': stats_before['pis'],
-                  'pos': stats_before['pos'],
-                  'gates': stats_before['gates'],
-                  'depth': stats_before['depth'],
-                  'inverters': stats_before['inverters'],
-                  'luts': stats_before['luts'],
-                  'lut_depth': stats_before['lut_depth'],
-                  'qca_area': stats_before['qca_area'],
-                  'qca_delay': stats_before['qca_delay'],
-                  'qca_energy': stats_before['qca_energy'],
-                  'stmg_area': stats_before['stmg_area'],
-                  'stmg_delay': stats_before['stmg_delay'],
-                  'stmg_energy': stats_before['stmg_energy'],
-                  'time': 0.0,
-               },
-               name: {
-                  'pis': stats_before['pis'],
-                  'pos': stats_before['pos'],
-                  'gates': stats_after['gates'],
-                  'depth': stats_after['depth'],
-                  'inverters': stats_after['inverters'],
-                  'luts': stats_after['luts'],
-                  'lut_depth': stats_after['lut_depth'],
-                  'qca_area': stats_after['qca_area'],
-                  'qca_delay': stats_after['qca_delay'],
-                  'qca_energy': stats_after['qca_energy'],
-                  'stmg_area': stats_after['stmg_area'],
-                  'stmg_delay': stats_after['stmg_delay'],
-                  'stmg_energy': stats_after['stmg_energy'],
-                  'time': stats_opt['time_total'],
-               }
-            }
-         else:
-            table[benchmark][name] = {
-               'pis': stats_before['pis'],
-               'pos': stats_before['pos'],
-               'gates': stats_after['gates'],
-               'depth': stats_after['depth'],
-               'inverters': stats_after['inverters'],
-               'luts': stats_after['luts'],
-               'lut_depth': stats_after['lut_depth'],
-               'qca_area': stats_after['qca_area'],
-               'qca_delay': stats_after['qca_delay'],
-               'qca_energy': stats_after['qca_energy'],
-               'stmg_area': stats_after['stmg_area'],
-               'stmg_delay': stats_after['stmg_delay'],
-               'stmg_energy': stats_after['stmg_energy'],
-               'time': stats_opt['time_total'],
-            }
-
-         # print progress for each benchmark
-         if print_progress:
-            print(table[benchmark][name], verified)
-      except Exception as exc:  # noqa: BLE001
-         if f"--{name}" in str(exc) and "not expected" in str(exc):
-            unsupported_configurations.add(name)
-            supported_stores.discard(name)
-            print(f"[w] marking configuration '{name}' as unsupported after failure: {exc}")
-            continue
-         print(f"[e] flow failed for {benchmark} with {name}: {exc}")
-      finally:
-         clear_store()
-
-# Generate final table in LATEX format
+# Table layout (defined up front so rows can be streamed out as each
+# benchmark completes instead of buffering the whole table).
 network_order = list(configurations.keys())
 header = [
    "Benchmark",
@@ -388,59 +321,7 @@ for net in network_order:
       f"Time$_{{{net}}}$",
    ])
 
-col_spec = "l" + "r" * (len(header) - 1)
-print("\\begin{tabular}{" + col_spec + "}")
-print(" & ".join(header) + " \\\\ \\hline")
-
-for benchmark in benchmarks.keys():
-   benchmark_data = table.get(benchmark)
-   if not benchmark_data or 'baseline' not in benchmark_data:
-      print(f"[w] skipping {benchmark}: baseline missing")
-      continue
-
-   base = benchmark_data['baseline']
-   row = [
-      benchmark,
-      f"{base['pis']}/{base['pos']}",
-      f"{base['gates']}",
-      f"{base['depth']}",
-      f"{base['inverters']}",
-      f"{base['luts']}",
-      f"{base['lut_depth']}",
-      f"{base['qca_area']}",
-      f"{base['qca_delay']}",
-      f"{base['qca_energy']}",
-      f"{base['stmg_area']}",
-      f"{base['stmg_delay']}",
-      f"{base['stmg_energy']}",
-   ]
-
-   for net in network_order:
-      data = benchmark_data.get(net) if benchmark_data else None
-      if data is None:
-         missing = ["-"] * 11 + ["-"]  # gates, depth, inv, luts, lut_depth, qca_area, qca_delay, qca_energy, stmg_area, stmg_delay, stmg_energy, time
-         row.extend(missing)
-         continue
-      row.extend([
-         f"{data['gates']}",
-         f"{data['depth']}",
-         f"{data['inverters']}",
-         f"{data['luts']}",
-         f"{data['lut_depth']}",
-         f"{data['qca_area']}",
-         f"{data['qca_delay']}",
-         f"{data['qca_energy']}",
-         f"{data['stmg_area']}",
-         f"{data['stmg_delay']}",
-         f"{data['stmg_energy']}",
-         f"{data['time']:.2f}",
-      ])
-
-   print(" & ".join(row) + " \\\\")
-
-print("\\end{tabular}")
-
-# Emit CSV with the same data (plus QCA/STMG) for easy copying.
+# CSV mirrors the LaTeX table (plus QCA/STMG) for easy copying.
 csv_header = [
    "benchmark",
    "pis",
@@ -473,55 +354,271 @@ for net in network_order:
       f"time_{net}",
    ])
 
+# Per-network stat columns, in emission order; itemgetter batches the
+# dict lookups into a single C-level call per row segment.
+STAT_KEYS = ('gates', 'depth', 'inverters', 'luts', 'lut_depth',
+             'qca_area', 'qca_delay', 'qca_energy',
+             'stmg_area', 'stmg_delay', 'stmg_energy')
+get_stats = operator.itemgetter(*STAT_KEYS)
+
+def build_latex_row(benchmark):
+   benchmark_data = table.get(benchmark)
+   if not benchmark_data or 'baseline' not in benchmark_data:
+      print(f"[w] skipping {benchmark}: baseline missing")
+      return None
+
+   base = benchmark_data['baseline']
+   row = [benchmark, f"{base['pis']}/{base['pos']}"]
+   row.extend(map(str, get_stats(base)))
+
+   for net in network_order:
+      data = benchmark_data.get(net)
+      if data is None:
+         row.extend(["-"] * (len(STAT_KEYS) + 1))  # stats + time
+         continue
+      row.extend(map(str, get_stats(data)))
+      row.append(f"{data['time']:.2f}")
+
+   return row
+
+def build_csv_row(benchmark):
+   if benchmark not in table or 'baseline' not in table[benchmark]:
+      print(f"[w] skipping {benchmark} in CSV: baseline missing")
+      return None
+
+   base = table[benchmark]['baseline']
+   row = [benchmark, base['pis'], base['pos']]
+   row.extend(get_stats(base))
+
+   for net in network_order:
+      data = table[benchmark].get(net)
+      if data is None:
+         row.extend([None] * (len(STAT_KEYS) + 1))  # stats + time
+         continue
+      row.extend(get_stats(data))
+      row.append(f"{data['time']:.2f}")
+
+   return row
+
+table = {}
+verify_pool = concurrent.futures.ProcessPoolExecutor(max_workers=2)
+verify_futures = {}
+
+# Stream results out per completed benchmark instead of holding the
+# full table until the end of the sweep.
+pending_configs = {benchmark: set(configurations.keys()) for benchmark in benchmarks}
+latex_rows = []
 csv_path = ROOT / "New_OG_30_50_blif_results" / "summary_on_New_OG_30_50_blifs.csv"
 csv_path.parent.mkdir(parents=True, exist_ok=True)
-with csv_path.open("w", newline="") as csvfile:
-   writer = csv.writer(csvfile)
-   writer.writerow(csv_header)
+csvfile = csv_path.open("w", newline="")
+csv_writer = csv.writer(csvfile)
+csv_writer.writerow(csv_header)
+
+def mark_pair_done(benchmark, name):
+   """Emit a benchmark's table rows once all its configurations finished."""
+   pending = pending_configs[benchmark]
+   pending.discard(name)
+   if pending:
+      return
+   csv_row = build_csv_row(benchmark)
+   if csv_row is not None:
+      csv_writer.writerow(csv_row)
+   latex_row = build_latex_row(benchmark)
+   if latex_row is not None:
+      latex_rows.append(latex_row)
 
-   for benchmark in benchmarks.keys():
-      if benchmark not in table or 'baseline' not in table[benchmark]:
-         print(f"[w] skipping {benchmark} in CSV: baseline missing")
-         continue
+# table = {
+#     'adder' :
+#     {
+#         'baseline': { 'gates': gates, 'depth': depth, 'luts': luts, 'time': time },
+#         'aig': { ... } ,
+#         'mig': { ... },
+#         'xag': { ... },
+#         'xmg': { ... },
+#     }
+#     ...
+# }
+
+def run_pair(benchmark, benchmark_params, name, inline_verify=False):
+   """Run one (benchmark, configuration) pair and return its statistics."""
+   result = {
+      'benchmark': benchmark,
+      'name': name,
+      'stats_before': None,
+      'stats_after': None,
+      'stats_opt': None,
+      'verified': color.BLUE + '[not checked]' + color.ENDC,
+      'unsupported': False,
+      'error': None,
+   }
+   try:
+      print(f"[i] run {benchmark} with {name}")
+
+      # read benchmark
+      in_filename = aigerfile(benchmark)
+      read(name, in_filename)
+
+      # snapshot the cheap baseline stats straight off the single read,
+      # then run the destructive LUT-mapping pass; only the 'lut' store
+      # gets dirtied, so drop that and keep the loaded network instead
+      # of clearing everything and re-reading
+      stats_before = compute_ntk_stats(name)
+      stats_before.update(compute_lut_stats(name))
+      clear_store('lut')
+
+      # run flow script
+      stats_opt = run_flow(compress2rs_bound, name, verbose)
+
+      # compute statistics for optimized benchmark
+      stats_after = compute_stats(name)
+
+      # write result file
+      out_filename = resultfile(benchmark, name, 'v')
+      write(name, out_filename)
+
+      result['stats_before'] = stats_before
+      result['stats_after'] = stats_after
+      result['stats_opt'] = stats_opt
+
+      # verify final result using ABC CEC; in serial mode it runs in the
+      # background so the CEC overlaps with the next pair's optimization
+      if benchmark_params['verify']:
+         if inline_verify:
+            # one log per (benchmark, configuration): concurrent CECs of
+            # the same benchmark must not write the same file
+            output = abc_cec(in_filename, out_filename, f"abc_{benchmark}_{name}.log")
+            if "Networks are equivalent" in output:
+               result['verified'] = color.GREEN + '[verified]' + color.ENDC
+            else:
+               print('[e] verification after optimization failed')
+               result['verified'] = color.RED + '[failed]' + color.ENDC
+         else:
+            verify_futures[(benchmark, name)] = verify_pool.submit(
+               abc_cec, in_filename, out_filename, f"abc_{benchmark}_{name}.log"
+            )
+            result['verified'] = color.YELLOW + '[pending]' + color.ENDC
+   except Exception as exc:  # noqa: BLE001
+      if f"--{name}" in str(exc) and "not expected" in str(exc):
+         result['unsupported'] = True
+      result['error'] = str(exc)
+   finally:
+      # only the pair's own store and the 'lut' store were touched, so
+      # avoid tearing down and rebuilding every other store
+      clear_store(name, 'lut')
+   return result
+
+def record_result(result):
+   benchmark = result['benchmark']
+   name = result['name']
+   if result['unsupported']:
+      unsupported_configurations.add(name)
+      supported_stores.discard(name)
+      _rebuild_clear_kwargs()
+      print(f"[w] marking configuration '{name}' as unsupported after failure: {result['error']}")
+      mark_pair_done(benchmark, name)
+      return
+   if result['error'] is not None:
+      print(f"[e] flow failed for {benchmark} with {name}: {result['error']}")
+      mark_pair_done(benchmark, name)
+      return
+
+   stats_before = result['stats_before']
+   stats_after = result['stats_after']
+   stats_opt = result['stats_opt']
+
+   # update table
+   if (not benchmark in table):
+      table[benchmark] = {
+         'baseline': {
+            'pis': stats_before['pis'],
+            'pos': stats_before['pos'],
+            'gates': stats_before['gates'],
+            'depth': stats_before['depth'],
+            'inverters': stats_before['inverters'],
+            'luts': stats_before['luts'],
+            'lut_depth': stats_before['lut_depth'],
+            'qca_area': stats_before['qca_area'],
+            'qca_delay': stats_before['qca_delay'],
+            'qca_energy': stats_before['qca_energy'],
+            'stmg_area': stats_before['stmg_area'],
+            'stmg_delay': stats_before['stmg_delay'],
+            'stmg_energy': stats_before['stmg_energy'],
+            'time': 0.0,
+         },
+      }
+   table[benchmark][name] = {
+      'pis': stats_before['pis'],
+      'pos': stats_before['pos'],
+      'gates': stats_after['gates'],
+      'depth': stats_after['depth'],
+      'inverters': stats_after['inverters'],
+      'luts': stats_after['luts'],
+      'lut_depth': stats_after['lut_depth'],
+      'qca_area': stats_after['qca_area'],
+      'qca_delay': stats_after['qca_delay'],
+      'qca_energy': stats_after['qca_energy'],
+      'stmg_area': stats_after['stmg_area'],
+      'stmg_delay': stats_after['stmg_delay'],
+      'stmg_energy': stats_after['stmg_energy'],
+      'time': stats_opt['time_total'],
+   }
+
+   # print progress for each benchmark
+   if print_progress:
+      print(table[benchmark][name], result['verified'])
+
+   mark_pair_done(benchmark, name)
 
-      base = table[benchmark]['baseline']
-      row = [
-         benchmark,
-         base['pis'],
-         base['pos'],
-         base['gates'],
-         base['depth'],
-         base['inverters'],
-         base['luts'],
-         base['lut_depth'],
-         base['qca_area'],
-         base['qca_delay'],
-         base['qca_energy'],
-         base['stmg_area'],
-         base['stmg_delay'],
-         base['stmg_energy'],
-      ]
-
-      for net in network_order:
-         data = table[benchmark].get(net)
-         if data is None:
-            row.extend([None] * 11 + [None])
+pairs = [
+   (benchmark, benchmark_params, name)
+   for benchmark, benchmark_params in benchmarks.items()
+   for name in configurations.keys()
+]
+
+if parallel_jobs > 1:
+   # Each worker process gets its own cirkit store, so pairs run fully
+   # independently and no clear_store is needed between them.
+   with concurrent.futures.ProcessPoolExecutor(max_workers=parallel_jobs) as pair_pool:
+      pair_futures = []
+      for benchmark, benchmark_params, name in pairs:
+         if name in unsupported_configurations:
+            mark_pair_done(benchmark, name)
             continue
-         row.extend([
-            data['gates'],
-            data['depth'],
-            data['inverters'],
-            data['luts'],
-            data['lut_depth'],
-            data['qca_area'],
-            data['qca_delay'],
-            data['qca_energy'],
-            data['stmg_area'],
-            data['stmg_delay'],
-            data['stmg_energy'],
-            f"{data['time']:.2f}",
-         ])
-
-      writer.writerow(row)
+         pair_futures.append(pair_pool.submit(run_pair, benchmark, benchmark_params, name, True))
+      for future in pair_futures:
+         record_result(future.result())
+else:
+   for benchmark, benchmark_params, name in pairs:
+      if name in unsupported_configurations:
+         print(f"[w] skipping {benchmark} with {name}: configuration not supported")
+         mark_pair_done(benchmark, name)
+         continue
+      record_result(run_pair(benchmark, benchmark_params, name))
 
+# Collect the backgrounded verification results
+for (benchmark, name), future in verify_futures.items():
+   try:
+      output = future.result()
+   except Exception as exc:  # noqa: BLE001
+      print(f"[e] verification failed to run for {benchmark} with {name}: {exc}")
+      continue
+   if "Networks are equivalent" in output:
+      verified = color.GREEN + '[verified]' + color.ENDC
+   else:
+      print(f'[e] verification after optimization failed for {benchmark} with {name}')
+      verified = color.RED + '[failed]' + color.ENDC
+   print(f"[i] {benchmark} with {name}: {verified}")
+verify_pool.shutdown()
+
+# Generate final table in LATEX format; the rows were already streamed
+# into latex_rows (and the CSV file) as each benchmark completed.
+col_spec = "l" + "r" * (len(header) - 1)
+sys.stdout.write(
+   "\\begin{tabular}{" + col_spec + "}\n"
+   + " & ".join(header) + " \\\\ \\hline\n"
+   + "".join(" & ".join(row) + " \\\\\n" for row in latex_rows)
+   + "\\end{tabular}\n"
+)
+
+csvfile.close()
 print(f"[i] CSV written to {csv_path}")
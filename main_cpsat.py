@@ -1,4 +1,6 @@
+import functools
 import json
+import logging
 import os
 import shutil
 import subprocess
@@ -7,6 +9,18 @@ from pathlib import Path
 
 from ortools.sat.python import cp_model
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec.msgpack
+except ImportError:
+    msgspec = None
+
+log = logging.getLogger(__name__)
+
 
 def _status_to_str(status):
     if status == cp_model.OPTIMAL:
@@ -22,6 +36,16 @@ def _status_to_str(status):
 
 def _find_cut_enumeration_binary(binary_hint, blif_path):
     """Return an executable path for cut_enumeration."""
+    return _resolve_cut_enum(binary_hint, str(Path(blif_path).parent))
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_cut_enum(binary_hint, parent):
+    """Locate the cut_enumeration binary for a (hint, BLIF directory) pair.
+
+    Cached so batch invocations of solve_circuit (e.g. objective sweeps
+    over one directory) do not repeat the which/stat probing per call.
+    """
     candidates = []
     if binary_hint:
         hint_path = Path(binary_hint)
@@ -32,7 +56,7 @@ def _find_cut_enumeration_binary(binary_hint, blif_path):
             return resolved
         raise FileNotFoundError(f"cut_enumeration binary '{binary_hint}' not found")
 
-    parent_candidate = Path(blif_path).parent / "cut_enumeration"
+    parent_candidate = Path(parent) / "cut_enumeration"
     candidates.append(parent_candidate)
     script_dir_candidate = Path(__file__).resolve().parent / "cut_enumeration"
     candidates.append(script_dir_candidate)
@@ -64,9 +88,7 @@ def _generate_cuts_json_from_blif(blif_path, binary_hint=None, cut_size=None):
     cmd = [cut_enum_bin, str(blif_path), str(tmp_path)]
     if cut_size is not None:
         cmd.append(str(cut_size))
-    print(
-        f"Converting BLIF to cuts JSON via '{cut_enum_bin}' (output: {tmp_path})"
-    )
+    log.info("Converting BLIF to cuts JSON via '%s' (output: %s)", cut_enum_bin, tmp_path)
     try:
         subprocess.run(cmd, check=True)
     except subprocess.CalledProcessError as exc:
@@ -79,11 +101,33 @@ def _generate_cuts_json_from_blif(blif_path, binary_hint=None, cut_size=None):
 
 
 def _load_cuts_data(cuts_path, binary_hint=None, cut_size=None):
-    """Load cut data either directly from JSON or via BLIF conversion."""
+    """Load cut data from JSON, a file-like object, or via BLIF conversion.
+
+    Accepting an open file-like object (anything with .read) lets drivers
+    stream cut_enumeration output straight into the solver without a disk
+    round-trip; the path form stays the default for CLI use.
+    """
+    if hasattr(cuts_path, "read"):
+        raw = cuts_path.read()
+        if isinstance(raw, str):
+            raw = raw.encode()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
     cuts_path = Path(cuts_path)
     if not cuts_path.exists():
         raise FileNotFoundError(f"Cuts file '{cuts_path}' does not exist")
 
+    if cuts_path.suffix.lower() == ".msgpack":
+        # MessagePack parses several times faster than JSON and the files
+        # are ~30% smaller; requires a cut_enumeration build that emits it.
+        if msgspec is None:
+            raise RuntimeError(
+                f"'{cuts_path}' is a msgpack cuts file but msgspec is not installed"
+            )
+        return msgspec.msgpack.decode(cuts_path.read_bytes())
+
     temp_json = None
     if cuts_path.suffix.lower() != ".json":
         temp_json = _generate_cuts_json_from_blif(
@@ -94,9 +138,14 @@ def _load_cuts_data(cuts_path, binary_hint=None, cut_size=None):
         json_path = cuts_path
 
     try:
-        with open(json_path, "r") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as exc:
+        if orjson is not None:
+            # C-backed parser; several times faster than stdlib json on
+            # the large cut files big BLIFs produce.
+            data = orjson.loads(Path(json_path).read_bytes())
+        else:
+            with open(json_path, "r") as f:
+                data = json.load(f)
+    except ValueError as exc:  # covers json and orjson JSONDecodeError
         if temp_json is None:
             raise ValueError(
                 f"Cuts file '{cuts_path}' is not valid JSON"
@@ -112,108 +161,181 @@ def _load_cuts_data(cuts_path, binary_hint=None, cut_size=None):
 
 
 def _normalize_cuts_data(data):
-    """Ensure cuts JSON uses dict-form cuts with default costs."""
-    nodes = data.get("nodes", [])
-    normalized_nodes = []
-    for nd in nodes:
-        cuts = []
-        for cut in nd.get("cuts", []):
-            if isinstance(cut, dict):
-                cuts.append(cut)
-            else:
+    """Ensure cuts JSON uses dict-form cuts with default costs.
+
+    Mutates in place; copying every node dict would double peak memory
+    on large inputs for no benefit.
+    """
+    for nd in data.get("nodes", []):
+        cuts = nd.setdefault("cuts", [])
+        for i, cut in enumerate(cuts):
+            if not isinstance(cut, dict):
                 # Interpret a bare list as leaves-only; fill in default costs.
-                cuts.append({
+                cuts[i] = {
                     "leaves": list(cut),
                     "inv_cost": 0,
                     "area_cost": len(cut),
                     "depth_cost": 1,
-                })
-        nd_copy = dict(nd)
-        nd_copy["cuts"] = cuts
-        normalized_nodes.append(nd_copy)
-    data["nodes"] = normalized_nodes
-    if "inputs" not in data:
-        data["inputs"] = []
+                }
+    data.setdefault("nodes", [])
+    data.setdefault("inputs", [])
     return data
 
 
 def _compute_depth_upper_bound(data):
     """Compute a heuristic depth upper bound using a greedy depth calculation."""
+    # Memoize on the data dict so retries / portfolio variants that pass
+    # the same parsed cuts around do not repeat the DAG traversal.
+    cached = data.get("_depth_ub")
+    if cached is not None:
+        return cached
     nodes = data.get("nodes", [])
     outputs = data.get("outputs") or []
-    node_map = {nd["name"]: nd for nd in nodes}
+    name_to_idx = {nd["name"]: i for i, nd in enumerate(nodes)}
     if not outputs:
-        if "Nout" in node_map:
+        if "Nout" in name_to_idx:
             outputs = ["Nout"]
         elif nodes:
             outputs = [nodes[-1]["name"]]
 
-    memo = {}
-    visiting = set()
-
-    def depth(name):
-        if name in memo:
-            return memo[name]
-        if name in visiting:
-            # Cycle detected; return a conservative bound.
-            return len(nodes) or 1
-        nd = node_map.get(name)
-        if nd is None:
-            memo[name] = 0
-            return 0
-        visiting.add(name)
-        best = None
+    num_nodes = len(nodes)
+    # Pre-resolve every cut to (internal leaf indices, depth step) so the
+    # DP below works on list indexing instead of string-keyed dict lookups.
+    cuts_by_idx = []
+    for nd in nodes:
+        nname = nd["name"]
+        resolved = []
         for cut in nd.get("cuts", []):
             leaves_raw = cut.get("leaves", [])
-            if len(leaves_raw) == 1 and leaves_raw[0] == name:
+            if len(leaves_raw) == 1 and leaves_raw[0] == nname:
                 # Skip self-cuts to stay consistent with model construction.
                 continue
-            leaves = [l for l in leaves_raw if l != name]
-            leaf_depth = max((depth(l) for l in leaves), default=0)
-            cut_depth = leaf_depth + int(cut.get("depth_cost", 1) or 1)
-            if best is None or cut_depth < best:
-                best = cut_depth
-        visiting.remove(name)
-        best = best if best is not None else 0
-        memo[name] = best
-        return best
-
-    ub_candidates = [depth(out) for out in outputs] if outputs else []
-    base = max(ub_candidates) if ub_candidates else len(nodes) or 1
-    # Add slack so the "upper bound" is not accidentally too tight.
-    ub_with_slack = max(base + 10, int(base * 1.5))
-    # Force UB to be at least the number of nodes to avoid infeasibility from an undershoot.
-    ub = max(ub_with_slack, len(nodes) or 1)
-    return max(1, ub)
+            leaf_ids = [
+                name_to_idx[l]
+                for l in leaves_raw
+                if l != nname and l in name_to_idx
+            ]
+            resolved.append((leaf_ids, int(cut.get("depth_cost", 1) or 1)))
+        cuts_by_idx.append(resolved)
+
+    # Iterative DFS with WHITE/GRAY/BLACK coloring; avoids Python
+    # recursion (and its frame overhead / recursion limit) on large DAGs.
+    WHITE, GRAY, BLACK = 0, 1, 2
+    color = [WHITE] * num_nodes
+    memo = [0] * num_nodes
+    # Longest path over the union of all cuts: an upper bound on the
+    # level of a node under *any* cut selection, so it bounds D without
+    # the slack inflation a greedy estimate would need.
+    worst = [0] * num_nodes
+    cyclic = False
+
+    for out in outputs:
+        root = name_to_idx.get(out)
+        if root is None:
+            continue
+        stack = [(root, False)]
+        while stack:
+            idx, expanded = stack.pop()
+            if expanded:
+                best = None
+                worst_depth = 0
+                for leaf_ids, step in cuts_by_idx[idx]:
+                    leaf_depth = max((memo[l] for l in leaf_ids), default=0)
+                    cut_depth = leaf_depth + step
+                    if best is None or cut_depth < best:
+                        best = cut_depth
+                    worst_leaf = max((worst[l] for l in leaf_ids), default=0)
+                    if worst_leaf + step > worst_depth:
+                        worst_depth = worst_leaf + step
+                memo[idx] = best if best is not None else 0
+                worst[idx] = worst_depth
+                color[idx] = BLACK
+                continue
+            if color[idx] == BLACK:
+                continue
+            if color[idx] == GRAY:
+                cyclic = True
+                continue
+            color[idx] = GRAY
+            stack.append((idx, True))
+            for leaf_ids, _ in cuts_by_idx[idx]:
+                for l in leaf_ids:
+                    if color[l] == WHITE:
+                        stack.append((l, False))
+                    elif color[l] == GRAY:
+                        cyclic = True
+
+    ub_candidates = [
+        worst[name_to_idx[out]] if out in name_to_idx else 0 for out in outputs
+    ]
+    base = max(ub_candidates) if ub_candidates else num_nodes or 1
+    if cyclic:
+        # Cycle detected; fall back to a conservative bound.
+        base = max(base, num_nodes or 1)
+    # The union-path bound is already sound for every cut selection, so a
+    # small additive cushion suffices; a tight UB keeps the level/D
+    # domains (and CP-SAT's internal booleanization) small.
+    ub = max(1, base + 2)
+    data["_depth_ub"] = ub
+    return ub
 
 
 def _extract_chosen_cuts(node_dicts, var_node_used, var_cut, solver):
+    # Read the flat solution array out of the response proto once instead
+    # of crossing the pybind boundary with solver.Value per variable.
+    solution = solver.ResponseProto().solution
     chosen_cuts = {}
     for nd in node_dicts:
         nname = nd["name"]
-        if solver.Value(var_node_used[nname]) == 1:
-            cuts_for_node = var_cut[nname]
-            for ci in cuts_for_node:
-                if solver.Value(ci["var"]) == 1:
+        if solution[var_node_used[nname].Index()] == 1:
+            for ci in var_cut[nname]:
+                if solution[ci["var"].Index()] == 1:
                     chosen_cuts[nname] = ci["cut_index"]
                     break
     return chosen_cuts
 
 
+def _write_chosen_cuts(chosen_json_path, chosen_cuts):
+    out = {"chosen_cuts": chosen_cuts}
+    if orjson is not None:
+        # C-level serializer; one write instead of incremental dumps.
+        Path(chosen_json_path).write_bytes(orjson.dumps(out, option=orjson.OPT_INDENT_2))
+    else:
+        with open(chosen_json_path, "w") as f:
+            json.dump(out, f, indent=2)
+    log.info("Written chosen cuts to %s", chosen_json_path)
+
+
 def solve_circuit(
     cuts_path,
     chosen_json_path,
     objective_mode="original",
     cut_enum_bin=None,
     cut_size=None,
+    warm_start=False,
+    num_workers=None,
 ):
+    """Select cuts for one circuit under the given objective.
+
+    objective_mode may also be a comma-separated string (or sequence) of
+    modes; the model is then built once and each mode is applied to a
+    proto clone, with per-mode outputs written next to chosen_json_path.
+    """
+    if isinstance(objective_mode, str):
+        modes = [m.strip() for m in objective_mode.split(",") if m.strip()]
+    else:
+        modes = [m for m in objective_mode if m]
+    if not modes:
+        modes = ["original"]
+    objective_mode = modes[0]
+
     data = _load_cuts_data(cuts_path, binary_hint=cut_enum_bin, cut_size=cut_size)
     data = _normalize_cuts_data(data)
     node_dicts = data["nodes"]
     outputs = data.get("outputs", [])
     inputs = data.get("inputs") or []
 
-    def build_model(depth_bound=None, fix_depth=None):
+    def build_model(depth_bound=None):
         include_depth = depth_bound is not None
         model = cp_model.CpModel()
 
@@ -222,9 +344,23 @@ def solve_circuit(
             for nd in node_dicts
         }
 
-        node_names = {nd["name"] for nd in node_dicts}
+            # used for og objective
+        lambda_inv = 10
+        lambda_area = 1
+            # used for overall objective
+        alpha_depth = 100
+        beta_area = 10
+        gamma_inv = 1
+
+        node_names = frozenset(nd["name"] for nd in node_dicts)
         var_cut = {}
-        cut_counter = 0
+        # Parallel lists over all cut variables; WeightedSum over these
+        # builds each objective as one packed proto message instead of
+        # per-cut coeff*var expression objects.
+        all_cut_vars = []
+        inv_coeffs = []
+        area_coeffs = []
+        og_coeffs = []
         for nd_idx, nd in enumerate(node_dicts):
             nname = nd["name"]
             var_cut[nname] = []
@@ -237,15 +373,20 @@ def solve_circuit(
                 area_cost = cut_obj.get("area_cost", len(leaves))
                 depth_cost = cut_obj.get("depth_cost", 1)
                 cvar = model.NewBoolVar(f"cut_{nname}_{i}")
-                lex_weight = cut_counter
-                cut_counter += 1
+                all_cut_vars.append(cvar)
+                inv_coeffs.append(inv_cost)
+                area_coeffs.append(area_cost)
+                og_coeffs.append(lambda_inv * inv_cost + lambda_area * area_cost)
+                # Filter (and dedupe) the internal leaves once so the
+                # constraint loops below skip the membership checks.
+                internal_leaves = [l for l in set(leaves) if l in node_names]
                 var_cut[nname].append({
                     "var": cvar,
                     "leaves": leaves,
+                    "internal_leaves": internal_leaves,
                     "inv_cost": inv_cost,
                     "area_cost": area_cost,
                     "depth_cost": depth_cost,
-                    "lex_weight": lex_weight,
                     "cut_index": i,
                 })
 
@@ -258,16 +399,15 @@ def solve_circuit(
             else:
                 model.Add(var_node_used[nname] == 0)
 
-        # (B) cut -> leaves used (for internal leaves)
-        forced_1 = model.NewConstant(1)
+        # (B) cut -> leaves used (for internal leaves). The per-cut
+        # internal_leaves list is already deduplicated and filtered to
+        # known nodes; external leaves need no implication (a constant-1
+        # implication is a tautology).
         for nd in node_dicts:
             nname = nd["name"]
             for ci in var_cut[nname]:
-                for leaf in ci["leaves"]:
-                    if leaf in node_names:
-                        model.AddImplication(ci["var"], var_node_used[leaf])
-                    else:
-                        model.AddImplication(ci["var"], forced_1)
+                for leaf in ci["internal_leaves"]:
+                    model.AddImplication(ci["var"], var_node_used[leaf])
 
         level_vars = {}
         D = None
@@ -283,27 +423,25 @@ def solve_circuit(
                 if inp in level_vars:
                     model.Add(level_vars[inp] == 0)
 
-            big_m = max_depth_bound
             for nd in node_dicts:
                 nname = nd["name"]
                 if nname not in level_vars:
                     continue
                 node_level = level_vars[nname]
-                # Link levels to usage to avoid floating levels.
-                model.Add(node_level <= big_m * var_node_used[nname])
+                # Link levels to usage to avoid floating levels. Reified
+                # constraints propagate natively and avoid the loose
+                # big-M linearization.
+                model.Add(node_level == 0).OnlyEnforceIf(var_node_used[nname].Not())
                 if nname not in inputs:
-                    model.Add(node_level >= var_node_used[nname])
+                    model.Add(node_level >= 1).OnlyEnforceIf(var_node_used[nname])
                 for ci in var_cut[nname]:
                     cvar = ci["var"]
                     step = ci.get("depth_cost", 1) or 1
-                    for leaf in ci["leaves"]:
-                        if leaf in level_vars:
-                            model.Add(node_level >= level_vars[leaf] + step - big_m * (1 - cvar))
+                    for leaf in ci["internal_leaves"]:
+                        model.Add(node_level >= level_vars[leaf] + step).OnlyEnforceIf(cvar)
 
             for nname, lvl in level_vars.items():
                 model.Add(D >= lvl)
-            if fix_depth is not None:
-                model.Add(D == fix_depth)
 
         # force outputs as roots if present
         if outputs:
@@ -316,57 +454,40 @@ def solve_circuit(
             elif node_dicts:
                 root = node_dicts[-1]["name"]
                 model.Add(var_node_used[root] == 1)
-            # used for og objective
-        lambda_inv = 10
-        lambda_area = 1
-            # used for overall objective
-        alpha_depth = 100   
-        beta_area = 10
-        gamma_inv = 1
-
-        inv_terms = [
-            ci["inv_cost"] * ci["var"]
-            for nd in node_dicts
-            for ci in var_cut[nd["name"]]
-        ]
-        area_terms = [
-            ci["area_cost"] * ci["var"]
-            for nd in node_dicts
-            for ci in var_cut[nd["name"]]
-        ]
-        original_terms = [
-            (lambda_inv * ci["inv_cost"] + lambda_area * ci["area_cost"]) * ci["var"]
-            for nd in node_dicts
-            for ci in var_cut[nd["name"]]
-        ]
-
-        def apply_objective(mode):
+        def apply_objective(mode, target=None):
+            # The objective may be applied to a proto clone of this model
+            # (e.g. Phase B), which shares all variable indices.
+            if target is None:
+                target = model
             if mode in ("og", "original"):
-                primary_cost = cp_model.LinearExpr.Sum(original_terms)
-                model.Minimize(primary_cost)
+                target.Minimize(cp_model.LinearExpr.WeightedSum(all_cut_vars, og_coeffs))
             elif mode == "inv":
-                primary_cost = cp_model.LinearExpr.Sum(inv_terms)
-                model.Minimize(primary_cost)
+                target.Minimize(cp_model.LinearExpr.WeightedSum(all_cut_vars, inv_coeffs))
             elif mode == "area":
-                primary_cost = cp_model.LinearExpr.Sum(area_terms)
-                model.Minimize(primary_cost)
+                target.Minimize(cp_model.LinearExpr.WeightedSum(all_cut_vars, area_coeffs))
             elif mode == "depth":
                 if D is None:
                     raise RuntimeError("Depth objective requested but depth model not built.")
-                model.Minimize(D)
+                target.Minimize(D)
             elif mode == "overall":
                 if D is None:
                     raise RuntimeError("Overall objective requested but depth model not built.")
-                total_inv = cp_model.LinearExpr.Sum(inv_terms)
-                total_area = cp_model.LinearExpr.Sum(area_terms)
-                primary_cost = alpha_depth * D + beta_area * total_area + gamma_inv * total_inv
-                model.Minimize(primary_cost)
+                overall_coeffs = [
+                    beta_area * area + gamma_inv * inv
+                    for area, inv in zip(area_coeffs, inv_coeffs)
+                ]
+                target.Minimize(
+                    alpha_depth * D
+                    + cp_model.LinearExpr.WeightedSum(all_cut_vars, overall_coeffs)
+                )
             elif mode == "overall_tiebreak":
-                total_inv = cp_model.LinearExpr.Sum(inv_terms)
-                total_area = cp_model.LinearExpr.Sum(area_terms)
-                model.Minimize(beta_area * total_area + gamma_inv * total_inv)
+                tiebreak_coeffs = [
+                    beta_area * area + gamma_inv * inv
+                    for area, inv in zip(area_coeffs, inv_coeffs)
+                ]
+                target.Minimize(cp_model.LinearExpr.WeightedSum(all_cut_vars, tiebreak_coeffs))
             elif mode == "depth_tiebreak_area":
-                model.Minimize(cp_model.LinearExpr.Sum(area_terms))
+                target.Minimize(cp_model.LinearExpr.WeightedSum(all_cut_vars, area_coeffs))
             else:
                 raise ValueError(f"Unknown objective mode: {mode}")
 
@@ -376,8 +497,9 @@ def solve_circuit(
             "var_node_used": var_node_used,
             "var_cut": var_cut,
             "D": D,
-            "area_terms": area_terms,
-            "inv_terms": inv_terms,
+            "cut_vars": all_cut_vars,
+            "area_coeffs": area_coeffs,
+            "inv_coeffs": inv_coeffs,
             "level_vars": level_vars,
             "depth_bound": depth_bound,
         }
@@ -387,12 +509,17 @@ def solve_circuit(
         time_limit=10,
         absolute_gap=None,
         relative_gap=None,
-        num_workers=50,
+        num_workers=None,
         seed=1,
         stop_after_first=False,
+        subsolvers=None,
     ):
         solver = cp_model.CpSolver()
         solver.parameters.random_seed = seed
+        # CP-SAT is tuned for 8-16 workers; more just adds contention on
+        # the shared clause database and oversubscribes small machines.
+        if num_workers is None:
+            num_workers = min(os.cpu_count() or 8, 16)
         solver.parameters.num_search_workers = num_workers
         solver.parameters.max_time_in_seconds = time_limit
         solver.parameters.log_search_progress = False
@@ -402,9 +529,76 @@ def solve_circuit(
             solver.parameters.relative_gap_limit = relative_gap
         if stop_after_first:
             solver.parameters.stop_after_first_solution = True
+        if subsolvers:
+            # Restrict the complete-search worker portfolio; only names
+            # that pass CP-SAT's subsolver validation may be listed here.
+            solver.parameters.subsolvers.extend(subsolvers)
         status = solver.Solve(model)
         return solver, status
 
+    if len(modes) > 1:
+        # Objective sweep: pay parse + variable/constraint construction
+        # once, then swap only the objective per mode. Each mode solves a
+        # proto clone of the shared base (variable indices carry over),
+        # so presolve state never leaks between modes. "overall" is
+        # solved single-phase here with the combined weighted objective
+        # rather than the two-phase refinement of the scalar path.
+        need_depth = any(m in ("depth", "overall") for m in modes)
+        depth_bound = _compute_depth_upper_bound(data) if need_depth else None
+        base = build_model(depth_bound=depth_bound)
+        hint_vars = list(base["var_node_used"].values()) + base["cut_vars"]
+        if depth_bound is not None:
+            hint_vars += list(base["level_vars"].values()) + [base["D"]]
+        results = {}
+        prev_solution = None
+        for mode_idx, mode in enumerate(modes):
+            model_m = cp_model.CpModel()
+            # copy_from/clear_objective: the only clone API the pybind
+            # CpModelProto wrapper provides (no CopyFrom/ClearField).
+            model_m.Proto().copy_from(base["model"].Proto())
+            model_m.Proto().clear_objective()
+            base["apply_objective"](mode, model_m)
+            if prev_solution is not None:
+                # Seed with the previous mode's feasible assignment; the
+                # constraints are identical across modes, so it stays
+                # feasible and the solver optimizes from a near-optimum
+                # instead of rediscovering feasibility from scratch.
+                for v in hint_vars:
+                    model_m.AddHint(v, prev_solution[v.Index()])
+            solver, status = solve_model(
+                model_m,
+                time_limit=60 if mode in ("depth", "overall") else 15,
+                relative_gap=0.05,
+                num_workers=num_workers,
+                seed=0,
+            )
+            status_str = _status_to_str(status)
+            log.info("Sweep objective %s: %s", mode, status_str)
+            if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                prev_solution = solver.ResponseProto().solution
+                mode_objective = solver.ObjectiveValue()
+                mode_cuts = _extract_chosen_cuts(
+                    node_dicts, base["var_node_used"], base["var_cut"], solver
+                )
+                # The first listed mode owns the canonical output path so
+                # downstream stages (rebuild) keep working unchanged.
+                if mode_idx == 0:
+                    mode_path = Path(chosen_json_path)
+                else:
+                    p = Path(chosen_json_path)
+                    mode_path = p.with_name(f"{p.stem}_{mode}{p.suffix}")
+                _write_chosen_cuts(mode_path, mode_cuts)
+            else:
+                mode_objective = None
+                log.info("No feasible solution for objective %s.", mode)
+            results[mode] = {"status": status_str, "objective_value": mode_objective}
+        first = results[modes[0]]
+        return {
+            "status": first["status"],
+            "objective_value": first["objective_value"],
+            "modes": results,
+        }
+
     final_solver = None
     final_status = None
     final_D = None
@@ -413,29 +607,31 @@ def solve_circuit(
 
     if objective_mode in ("depth", "overall"):
         depth_bound = _compute_depth_upper_bound(data)
-        depth_bound = max(depth_bound, len(node_dicts) or 1)
-        print(f"Using depth upper bound UB = {depth_bound}")
+        log.info("Using depth upper bound UB = %d", depth_bound)
 
-        # Phase A: depth-only minimize D with relaxed gap and short cap.
+        # Build the model once; Phase B reuses the proto instead of paying
+        # for a second round of Python-side variable/constraint creation.
         phase_a = build_model(depth_bound=depth_bound)
+
+        # Phase A: depth-only minimize D with relaxed gap and short cap.
         phase_a["apply_objective"]("depth")
         solver_a, status_a = solve_model(
             phase_a["model"],
             time_limit=120,
             absolute_gap=1,
             relative_gap=None,
-            num_workers=16,
+            num_workers=num_workers,
             seed=1,
             stop_after_first=True,
         )
         status_a_str = _status_to_str(status_a)
-        print(f"Phase A status: {status_a_str}")
+        log.info("Phase A status: %s", status_a_str)
         if status_a not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-            print("No feasible solution in Phase A.")
+            log.info("No feasible solution in Phase A.")
             return {"status": status_a_str, "objective_value": None}
 
         best_depth = solver_a.Value(phase_a["D"])
-        print(f"Phase A best depth D = {best_depth}")
+        log.info("Phase A best depth D = %d", best_depth)
         phase_a_cuts = _extract_chosen_cuts(
             node_dicts, phase_a["var_node_used"], phase_a["var_cut"], solver_a
         )
@@ -445,29 +641,64 @@ def solve_circuit(
         final_objective = best_depth
         tie_objective = None
 
-        # Phase B: fix depth and minimize tie-breaker.
+        # Phase B: fix depth and minimize tie-breaker. Clone the Phase A
+        # proto (variable indices carry over) rather than rebuilding.
         tie_mode = "depth_tiebreak_area" if objective_mode == "depth" else "overall_tiebreak"
-        phase_b = build_model(depth_bound=depth_bound, fix_depth=best_depth)
-        phase_b["apply_objective"](tie_mode)
+        model_b = cp_model.CpModel()
+        # The pybind proto exposes copy_from/clear_objective (there is no
+        # CopyFrom/ClearField on the CpModelProto wrapper).
+        model_b.Proto().copy_from(phase_a["model"].Proto())
+        model_b.Proto().clear_objective()
+        # An upper bound is enough for tie-breaking: Phase A already
+        # proved best_depth is attainable, and <= leaves the solver free
+        # to prune (or even improve) depth while optimizing the
+        # tie-breaker.
+        model_b.Add(phase_a["D"] <= best_depth)
+        # Bias branching toward resolving the levels low first.
+        model_b.AddDecisionStrategy(
+            list(phase_a["level_vars"].values()),
+            cp_model.CHOOSE_FIRST,
+            cp_model.SELECT_MIN_VALUE,
+        )
+        phase_a["apply_objective"](tie_mode, model_b)
+        if warm_start:
+            # Seed Phase B with Phase A's feasible assignment so the
+            # solver improves the tie-breaker from a known solution
+            # instead of rediscovering feasibility. Opt-in: hints can
+            # occasionally mislead the search.
+            for v in phase_a["var_node_used"].values():
+                model_b.AddHint(v, solver_a.Value(v))
+            for cuts_for_node in phase_a["var_cut"].values():
+                for ci in cuts_for_node:
+                    model_b.AddHint(ci["var"], solver_a.Value(ci["var"]))
+            for lvl in phase_a["level_vars"].values():
+                model_b.AddHint(lvl, solver_a.Value(lvl))
+            model_b.AddHint(phase_a["D"], best_depth)
         solver_b, status_b = solve_model(
-            phase_b["model"],
+            model_b,
             time_limit=60,
-            num_workers=16,
+            num_workers=num_workers,
             seed=1,
+            # Phase B improves a bounded objective from a known-feasible
+            # region; steer the complete-search workers accordingly.
+            # Only complete subsolvers are valid in parameters.subsolvers
+            # (LNS worker names like rnd_var_lns are rejected with
+            # MODEL_INVALID); LNS workers are scheduled automatically.
+            subsolvers=["default_lp", "quick_restart"],
         )
         status_b_str = _status_to_str(status_b)
-        print(f"Phase B status: {status_b_str}")
+        log.info("Phase B status: %s", status_b_str)
         if status_b in (cp_model.OPTIMAL, cp_model.FEASIBLE):
             final_solver = solver_b
             final_status = status_b_str
-            final_D = solver_b.Value(phase_b["D"])
+            final_D = solver_b.Value(phase_a["D"])
             tie_objective = solver_b.ObjectiveValue()
             final_objective = best_depth
             chosen_cuts = _extract_chosen_cuts(
-                node_dicts, phase_b["var_node_used"], phase_b["var_cut"], solver_b
+                node_dicts, phase_a["var_node_used"], phase_a["var_cut"], solver_b
             )
         else:
-            print("No feasible solution in Phase B; returning Phase A solution.")
+            log.info("No feasible solution in Phase B; returning Phase A solution.")
             chosen_cuts = phase_a_cuts
     else:
         single = build_model(depth_bound=None)
@@ -476,38 +707,38 @@ def solve_circuit(
             single["model"],                        #this timing is for the others area/og/inv
             time_limit=15,
             relative_gap=0.05,
-            num_workers=50,
+            num_workers=num_workers,
             seed=0,
         )
         status_str = _status_to_str(status)
-        print(f"Status: {status_str}")
+        log.info("Status: %s", status_str)
         if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-            print("No feasible solution.")
+            log.info("No feasible solution.")
             return {"status": status_str, "objective_value": None}
         final_solver = solver
         final_status = status_str
-        final_D = solver.Value(single["D"]) if single["D"] else None
+        # build_model(depth_bound=None) never creates D in this path.
+        final_D = None
         final_objective = solver.ObjectiveValue()
         chosen_cuts = _extract_chosen_cuts(node_dicts, single["var_node_used"], single["var_cut"], solver)
 
-    print(f"Status: {final_status}")
+    log.info("Status: %s", final_status)
     if final_objective is not None:
-        print(f"Objective value ({objective_mode}) = {final_objective}")
+        log.info("Objective value (%s) = %s", objective_mode, final_objective)
     if objective_mode in ("depth", "overall"):
-        print("Global depth D =", final_D)
+        log.info("Global depth D = %s", final_D)
         if objective_mode in ("depth", "overall"):
-            print("Phase B tie-break objective =", tie_objective)
+            log.info("Phase B tie-break objective = %s", tie_objective)
 
-    out = {"chosen_cuts": chosen_cuts}
-    with open(chosen_json_path, "w") as f:
-        json.dump(out, f, indent=2)
-    print(f"Written chosen cuts to {chosen_json_path}")
+    _write_chosen_cuts(chosen_json_path, chosen_cuts)
 
     return {"status": final_status, "objective_value": final_objective}
 
 if __name__ == "__main__":
     import argparse
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     parser = argparse.ArgumentParser(description="CP-SAT cut selection driver")
     parser.add_argument(
         "--cuts",
@@ -536,6 +767,17 @@ if __name__ == "__main__":
         default=None,
         help="Optional K value to pass to cut_enumeration when converting BLIF inputs.",
     )
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="Hint Phase B with Phase A's solution (depth/overall objectives only).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="CP-SAT search workers (default: min(cpu_count, 16)).",
+    )
     args = parser.parse_args()
 
     solve_circuit(
@@ -544,4 +786,6 @@ if __name__ == "__main__":
         objective_mode=args.objective,
         cut_enum_bin=args.cut_enum_bin,
         cut_size=args.cut_size,
+        warm_start=args.warm_start,
+        num_workers=args.workers,
     )
@@ -1,7 +1,15 @@
 """One-shot pipeline: BLIF -> cut enumeration -> CP-SAT -> rebuild -> optional mapper."""
 
 import argparse
+import concurrent.futures
+import contextlib
 import csv
+import dataclasses
+import functools
+import hashlib
+import io
+import json
+import os
 import shutil
 import subprocess
 import time
@@ -11,65 +19,220 @@ from pathlib import Path
 from main_cpsat import solve_circuit
 
 
+_OBJECTIVE_MODES = ("og", "inv", "area", "depth", "overall")
+
+STATS_HEADERS = (
+    "timestamp",
+    "input_blif",
+    "output_dir",
+    "objective",
+    "cut_size",
+    "final_tool",
+    "cuts_json",
+    "chosen_json",
+    "rebuilt_blif",
+    "cp_sat_status",
+    "cp_sat_objective",
+    "cut_enum_time_s",
+    "cp_sat_time_s",
+    "rebuild_time_s",
+    "final_time_s",
+    "t_pre_s",
+    "t_total_s",
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PipelineConfig:
+    """Immutable per-run settings consumed by the pipeline stages.
+
+    Frozen + slotted: per-file variants are cheap dataclasses.replace
+    copies (no per-instance dict) and pickle compactly for the process
+    pool, instead of cloning a full argparse.Namespace per BLIF.
+    """
+
+    input_blif: str
+    objective: str = "og"
+    cut_size: int | None = None
+    output_dir: str | None = None
+    output_stem: str | None = None
+    cuts_json: str | None = None
+    chosen_json: str | None = None
+    rebuilt_blif: str | None = None
+    rebuilt_dir: str | None = None
+    tools_dir: str | None = None
+    cut_enum_bin: str | None = None
+    rebuild_bin: str | None = None
+    final_tool: str = "none"
+    stop_after_rebuild: bool = False
+    final_base: str | None = None
+    stats_csv: str | None = None
+    summary_csv: str | None = None
+    jobs: int | None = None
+    cp_sat_workers: int | None = None
+    cache_dir: str | None = None
+    no_cache: bool = False
+    force: bool = False
+    cuts_format: str = "json"
+    stream_cuts: bool = False
+
+    @classmethod
+    def from_args(cls, args):
+        names = {f.name for f in dataclasses.fields(cls)}
+        return cls(**{k: v for k, v in vars(args).items() if k in names})
+
+
+def _objective_arg(value):
+    """Validate a single objective mode or a comma-separated sweep."""
+    modes = [m.strip() for m in value.split(",") if m.strip()]
+    if not modes:
+        raise argparse.ArgumentTypeError("at least one objective mode is required")
+    for mode in modes:
+        if mode not in _OBJECTIVE_MODES:
+            raise argparse.ArgumentTypeError(
+                f"invalid objective '{mode}' (choose from {', '.join(_OBJECTIVE_MODES)})"
+            )
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _which_cached(name):
+    return shutil.which(name)
+
+
 def _resolve_binary(explicit, candidates, description, flag_hint=None):
+    """Resolve a stage binary, memoized per process.
+
+    Directory mode resolves the same two binaries for every BLIF; caching
+    turns the repeated which/is_file stat probing into a dict lookup.
+    """
+    return _resolve_binary_cached(
+        explicit,
+        tuple(str(c) if c is not None else None for c in candidates),
+        description,
+        flag_hint,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_binary_cached(explicit, candidates, description, flag_hint):
+    # Always return an absolute path: it pins the binary independent of
+    # later cwd changes and lets subprocess skip the PATH search, keeping
+    # CPython on its posix_spawn fast path.
     if explicit:
         p = Path(explicit)
         if p.is_file():
-            return str(p)
+            return str(p.resolve())
         raise FileNotFoundError(f"{description} '{explicit}' not found")
 
     for candidate in candidates:
         if candidate and Path(candidate).is_file():
-            return str(candidate)
+            return str(Path(candidate).resolve())
 
     flag = flag_hint or description.replace(" ", "-")
     raise FileNotFoundError(f"Unable to locate {description}; pass the --{flag} flag")
 
 
+def _alias_or_copy(src, dst):
+    """Materialize src at dst without copying bytes when possible.
+
+    Hardlinks make the alias an O(1) inode operation; the cross-device
+    fallback goes through shutil.copyfile, which uses sendfile on Linux.
+    Any existing dst is unlinked first so a stale alias never points at
+    content it no longer matches.
+    """
+    dst = Path(dst)
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _up_to_date(dst, *srcs):
+    """Make-style freshness check: dst exists and is newer than all srcs."""
+    dst = Path(dst)
+    return dst.exists() and all(
+        dst.stat().st_mtime >= Path(src).stat().st_mtime for src in srcs
+    )
+
+
+def _content_hash(path):
+    """Short content digest used to key the stage cache."""
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+
+
+def _tee_cut_enumeration(cmd, cuts_path):
+    """Run cut_enumeration writing to stdout and tee it to cuts_path.
+
+    The cuts file is written while the binary is still producing output,
+    and the same bytes are kept in memory so the solver starts parsing
+    the moment the binary exits instead of re-reading a flushed file.
+    Returns the in-memory stream, positioned at the start.
+    """
+    print("[run]", " ".join(str(c) for c in cmd), "(streaming)")
+    buf = io.BytesIO()
+    with open(cuts_path, "wb") as sink:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+        for chunk in iter(lambda: proc.stdout.read(1 << 20), b""):
+            sink.write(chunk)
+            buf.write(chunk)
+        returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+    buf.seek(0)
+    return buf
+
+
 def _run(cmd, cwd=None):
+    # cmd[0] is an absolute path and no preexec_fn/env tweaks are passed,
+    # so CPython launches via posix_spawn instead of fork+exec — cheaper
+    # when the parent has ortools' multi-GB RSS mapped.
     print("[run]", " ".join(str(c) for c in cmd))
     subprocess.run(cmd, check=True, cwd=cwd)
 
 
-def _append_stats_row(csv_path, headers, row):
-    csv_path = Path(csv_path)
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
-    write_header = not csv_path.exists() or csv_path.stat().st_size == 0
+class StatsAppender:
+    """Append stats rows to one CSV through a single long-lived handle.
 
-    with csv_path.open("a", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        if write_header:
-            writer.writeheader()
-        writer.writerow(row)
+    Directory-mode batches append one row per BLIF; keeping the file open
+    for the whole run avoids the per-row open/stat/close and header
+    re-check that a per-append helper pays.
+    """
 
+    def __init__(self, csv_path, headers):
+        self.csv_path = Path(csv_path)
+        self.headers = list(headers)
+        self._file = None
+        self._writer = None
 
-def _run_single_pipeline(args):
-    input_blif = Path(args.input_blif).resolve()
-    if not input_blif.is_file():
-        raise FileNotFoundError(f"Input BLIF '{input_blif}' not found")
-    if input_blif.suffix.lower() != ".blif":
-        raise ValueError("run_full_flow expects a BLIF file as input")
+    def __enter__(self):
+        self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+        write_header = not self.csv_path.exists() or self.csv_path.stat().st_size == 0
+        self._file = self.csv_path.open("a", newline="")
+        # csv.writer over plain value lists keeps quoting correct without
+        # DictWriter's per-row field mapping.
+        self._writer = csv.writer(self._file)
+        if write_header:
+            self._writer.writerow(self.headers)
+        return self
 
-    out_dir = Path(args.output_dir).resolve() if args.output_dir else input_blif.parent
-    out_dir.mkdir(parents=True, exist_ok=True)
+    def append(self, row):
+        self._writer.writerow([row.get(h, "") for h in self.headers])
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        self._file = None
+        self._writer = None
 
-    stem = args.output_stem or input_blif.stem
-    cuts_json = Path(args.cuts_json) if args.cuts_json else out_dir / f"{stem}_cuts.json"
-    chosen_json = Path(args.chosen_json) if args.chosen_json else out_dir / f"{stem}_chosen_cuts.json"
-    if args.rebuilt_blif:
-        rebuilt_blif = Path(args.rebuilt_blif)
-    elif args.rebuilt_dir:
-        rebuilt_dir = Path(args.rebuilt_dir).resolve()
-        rebuilt_dir.mkdir(parents=True, exist_ok=True)
-        rebuilt_blif = rebuilt_dir / f"{stem}_rebuilt.blif"
-    else:
-        rebuilt_blif = out_dir / f"{stem}_rebuilt.blif"
 
-    tools_dir = Path(args.tools_dir).resolve() if args.tools_dir else input_blif.parent
+def _resolve_stage_binaries(cfg, blif_parent):
+    """Resolve the cut_enumeration and rebuild binaries for one BLIF dir."""
+    tools_dir = Path(cfg.tools_dir).resolve() if cfg.tools_dir else Path(blif_parent)
     script_dir = Path(__file__).resolve().parent
     cut_enum_bin = _resolve_binary(
-        args.cut_enum_bin,
-        [tools_dir / "cut_enumeration", script_dir / "cut_enumeration", shutil.which("cut_enumeration")],
+        cfg.cut_enum_bin,
+        [tools_dir / "cut_enumeration", script_dir / "cut_enumeration", _which_cached("cut_enumeration")],
         "cut_enumeration binary",
         flag_hint="cut-enum-bin",
     )
@@ -77,48 +240,164 @@ def _run_single_pipeline(args):
     rebuild_candidates = [
         tools_dir / "rebuild_from_cpsat",
         script_dir / "rebuild_from_cpsat",
-        shutil.which("rebuild_from_cpsat"),
+        _which_cached("rebuild_from_cpsat"),
     ]
-    if args.cut_enum_bin:
-        rebuild_candidates.insert(0, Path(args.cut_enum_bin).resolve().parent / "rebuild_from_cpsat")
+    if cfg.cut_enum_bin:
+        rebuild_candidates.insert(0, Path(cfg.cut_enum_bin).resolve().parent / "rebuild_from_cpsat")
 
     rebuild_bin = _resolve_binary(
-        args.rebuild_bin,
+        cfg.rebuild_bin,
         rebuild_candidates,
         "rebuild_from_cpsat binary",
         flag_hint="rebuild-bin",
     )
+    return cut_enum_bin, rebuild_bin
 
-    stage_times = {}
+
+def _run_single_pipeline(cfg):
+    input_blif = Path(cfg.input_blif).resolve()
+    if not input_blif.is_file():
+        raise FileNotFoundError(f"Input BLIF '{input_blif}' not found")
+    if input_blif.suffix.lower() != ".blif":
+        raise ValueError("run_full_flow expects a BLIF file as input")
+
+    # One timestamp per pipeline run; every row for this file shares it.
+    run_timestamp = datetime.now().isoformat(timespec="seconds")
+
+    out_dir = Path(cfg.output_dir).resolve() if cfg.output_dir else input_blif.parent
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    stem = cfg.output_stem or input_blif.stem
+    cuts_ext = ".msgpack" if cfg.cuts_format == "msgpack" else ".json"
+    cuts_json = Path(cfg.cuts_json) if cfg.cuts_json else out_dir / f"{stem}_cuts{cuts_ext}"
+    chosen_json = Path(cfg.chosen_json) if cfg.chosen_json else out_dir / f"{stem}_chosen_cuts.json"
+    if cfg.rebuilt_blif:
+        rebuilt_blif = Path(cfg.rebuilt_blif)
+    elif cfg.rebuilt_dir:
+        rebuilt_dir = Path(cfg.rebuilt_dir).resolve()
+        rebuilt_dir.mkdir(parents=True, exist_ok=True)
+        rebuilt_blif = rebuilt_dir / f"{stem}_rebuilt.blif"
+    else:
+        rebuilt_blif = out_dir / f"{stem}_rebuilt.blif"
+
+    cut_enum_bin, rebuild_bin = _resolve_stage_binaries(cfg, input_blif.parent)
+
+    use_cache = not cfg.no_cache
+    if use_cache:
+        cache_dir = Path(cfg.cache_dir).resolve() if cfg.cache_dir else out_dir / ".flowcache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Content hash, not mtime: reruns after a touch or checkout still
+        # hit the cache as long as the netlist itself is unchanged.
+        blif_hash = _content_hash(input_blif)
+
+    # Stage durations accumulate as monotonic_ns integers (immune to
+    # clock adjustments, no float rounding); converted to seconds once
+    # when the report and stats row are built.
+    stage_times_ns = {}
 
     def _record(label, func):
-        start = time.perf_counter()
+        start = time.monotonic_ns()
         result = func()
-        stage_times[label] = time.perf_counter() - start
+        stage_times_ns[label] = time.monotonic_ns() - start
         return result
 
     # 1) cut enumeration
     ce_cmd = [cut_enum_bin, str(input_blif), str(cuts_json)]
-    if args.cut_size:
-        ce_cmd.append(str(args.cut_size))
-    _record("cut_enumeration", lambda: _run(ce_cmd))
+    if cfg.cut_size:
+        ce_cmd.append(str(cfg.cut_size))
+    if cfg.cuts_format == "msgpack":
+        ce_cmd.append("--format=msgpack")
+
+    # When streaming, holds the teed cut_enumeration output so the solver
+    # can parse it without re-reading cuts_json from disk.
+    cuts_buffer = None
+
+    def _run_cut_enum():
+        nonlocal cuts_buffer
+        if cfg.stream_cuts:
+            stream_cmd = list(ce_cmd)
+            stream_cmd[2] = "/dev/stdout"
+            cuts_buffer = _tee_cut_enumeration(stream_cmd, cuts_json)
+        else:
+            _run(ce_cmd)
+
+    # mtimes alone cannot tell whether cuts_json was produced with the
+    # requested cut size, so a sidecar records it and a mismatch is stale.
+    cuts_meta = Path(f"{cuts_json}.meta")
+
+    def _cuts_meta_fresh():
+        try:
+            return json.loads(cuts_meta.read_text()).get("cut_size") == cfg.cut_size
+        except (OSError, ValueError):
+            return False
+
+    def _cut_enum_stage():
+        if not cfg.force and _up_to_date(cuts_json, input_blif) and _cuts_meta_fresh():
+            print(f"[skip] {cuts_json.name} is up to date")
+            return
+        if use_cache:
+            cached_cuts = cache_dir / f"{blif_hash}_k{cfg.cut_size or 'def'}.cuts{cuts_json.suffix}"
+            if cached_cuts.is_file() and not cfg.force:
+                print(f"[cache] cuts for {input_blif.name} <- {cached_cuts.name}")
+                _alias_or_copy(cached_cuts, cuts_json)
+            else:
+                # Break any hardlink from an earlier cache hit so the
+                # binary's truncating write cannot clobber a cached
+                # artifact.
+                Path(cuts_json).unlink(missing_ok=True)
+                _run_cut_enum()
+                _alias_or_copy(cuts_json, cached_cuts)
+        else:
+            _run_cut_enum()
+        cuts_meta.write_text(json.dumps({"cut_size": cfg.cut_size}))
+
+    _record("cut_enumeration", _cut_enum_stage)
 
     # 2) CP-SAT cut selection
-    cp_sat_result = _record(
-        "cp_sat",
-        lambda: solve_circuit(
-            str(cuts_json),
+    # The solver result lives in a sidecar next to chosen_json so warm
+    # reruns can skip the solve and still report status/objective. It
+    # also records the flags the selection depends on; a mismatch means
+    # the fresh-looking chosen_json answers a different question.
+    status_sidecar = Path(f"{chosen_json}.status")
+
+    def _read_status_sidecar():
+        try:
+            result = json.loads(status_sidecar.read_text())
+        except (OSError, ValueError):
+            return None
+        if result.get("objective") == cfg.objective and result.get("cut_size") == cfg.cut_size:
+            return result
+        return None
+
+    def _cp_sat_stage():
+        if not cfg.force and _up_to_date(chosen_json, cuts_json):
+            cached_result = _read_status_sidecar()
+            if cached_result is not None:
+                print(f"[skip] {chosen_json.name} is up to date")
+                return cached_result
+        # The in-memory stream only short-circuits JSON; msgpack content
+        # goes through the path so _load_cuts_data dispatches on suffix.
+        use_buffer = cuts_buffer is not None and cfg.cuts_format == "json"
+        result = solve_circuit(
+            cuts_buffer if use_buffer else str(cuts_json),
             str(chosen_json),
-            objective_mode=args.objective,
-        ),
-    ) or {}
+            objective_mode=cfg.objective,
+            num_workers=cfg.cp_sat_workers,
+        ) or {}
+        status_sidecar.write_text(
+            json.dumps({**result, "objective": cfg.objective, "cut_size": cfg.cut_size})
+        )
+        return result
+
+    cp_sat_result = _record("cp_sat", _cp_sat_stage) or {}
 
     cp_status = cp_sat_result.get("status", "")
     cp_good = cp_status in ("FEASIBLE", "OPTIMAL")
     if not cp_good:
         print(f"CP-SAT returned status {cp_status}; skipping rebuild and final steps.")
-        stage_times["rebuild"] = 0.0
-        stage_times["final"] = 0.0
+        stage_times_ns["rebuild"] = 0
+        stage_times_ns["final"] = 0
+        stage_times = {label: ns / 1e9 for label, ns in stage_times_ns.items()}
         t_pre = sum(stage_times.get(key, 0.0) for key in ("cut_enumeration", "cp_sat", "rebuild"))
         final_time = 0.0
         t_opt = 0.0
@@ -132,59 +411,39 @@ def _run_single_pipeline(args):
         print("T_opt   = 0.00s (skipped)")
         print(f"T_total = {t_total:.2f}s")
         print("Pipeline halted after CP-SAT.")
-        stats_path = Path(args.stats_csv).resolve() if args.stats_csv else out_dir / f"{stem}_stats.csv"
-        stats_headers = [
-            "timestamp",
-            "input_blif",
-            "output_dir",
-            "objective",
-            "cut_size",
-            "final_tool",
-            "cuts_json",
-            "chosen_json",
-            "rebuilt_blif",
-            "cp_sat_status",
-            "cp_sat_objective",
-            "cut_enum_time_s",
-            "cp_sat_time_s",
-            "rebuild_time_s",
-            "final_time_s",
-            "t_pre_s",
-            "t_total_s",
-        ]
-        stats_row = {
-            "timestamp": datetime.now().isoformat(timespec="seconds"),
-            "input_blif": str(input_blif),
-            "output_dir": str(out_dir),
-            "objective": args.objective,
-            "cut_size": args.cut_size if args.cut_size is not None else "",
-            "final_tool": args.final_tool,
-            "cuts_json": str(cuts_json),
-            "chosen_json": str(chosen_json),
-            "rebuilt_blif": str(rebuilt_blif),
-            "cp_sat_status": cp_sat_result.get("status", ""),
-            "cp_sat_objective": cp_sat_result.get("objective_value", ""),
-            "cut_enum_time_s": f"{stage_times.get('cut_enumeration', 0.0):.4f}",
-            "cp_sat_time_s": f"{stage_times.get('cp_sat', 0.0):.4f}",
-            "rebuild_time_s": f"{stage_times.get('rebuild', 0.0):.4f}",
-            "final_time_s": f"{final_time:.4f}",
-            "t_pre_s": f"{t_pre:.4f}",
-            "t_total_s": f"{t_total:.4f}",
-        }
-        _append_stats_row(stats_path, stats_headers, stats_row)
-        print(f"Stats appended to {stats_path}")
-        summary_path = Path(args.summary_csv).resolve() if args.summary_csv else out_dir / "summary_stats.csv"
-        _append_stats_row(summary_path, stats_headers, stats_row)
-        print(f"Summary appended to {summary_path}")
-        return
+        return _stats_result(cfg, run_timestamp, input_blif, out_dir, stem, cuts_json, chosen_json,
+                             rebuilt_blif, cp_sat_result, stage_times, final_time, t_pre, t_total)
 
     # 3) rebuild netlist
     rebuild_cmd = [rebuild_bin, str(input_blif), str(cuts_json), str(chosen_json), str(rebuilt_blif)]
-    _record("rebuild", lambda: _run(rebuild_cmd))
+
+    def _rebuild_stage():
+        if not cfg.force and _up_to_date(rebuilt_blif, cuts_json, chosen_json):
+            print(f"[skip] {Path(rebuilt_blif).name} is up to date")
+            return
+        if use_cache:
+            # The rebuild reads the BLIF, the cuts file, and the chosen
+            # cuts; all three hash into the key. Chosen cuts alone are
+            # just indices, which collide across different cuts files.
+            cached_rebuilt = cache_dir / (
+                f"{blif_hash}_{_content_hash(cuts_json)}_{_content_hash(chosen_json)}.rebuilt.blif"
+            )
+            if cached_rebuilt.is_file() and not cfg.force:
+                print(f"[cache] rebuilt BLIF for {input_blif.name} <- {cached_rebuilt.name}")
+                _alias_or_copy(cached_rebuilt, rebuilt_blif)
+                return
+            Path(rebuilt_blif).unlink(missing_ok=True)
+            _run(rebuild_cmd)
+            _alias_or_copy(rebuilt_blif, cached_rebuilt)
+            return
+        _run(rebuild_cmd)
+
+    _record("rebuild", _rebuild_stage)
 
     final_time = 0.0
     # No final mapping step; pipeline ends after rebuild
-    stage_times["final"] = 0.0
+    stage_times_ns["final"] = 0
+    stage_times = {label: ns / 1e9 for label, ns in stage_times_ns.items()}
     t_pre = sum(stage_times.get(key, 0.0) for key in ("cut_enumeration", "cp_sat", "rebuild"))
     t_opt = final_time
     t_total = t_pre + t_opt
@@ -195,40 +454,33 @@ def _run_single_pipeline(args):
         f"cp_sat {stage_times.get('cp_sat', 0.0):.2f}s + "
         f"rebuild {stage_times.get('rebuild', 0.0):.2f}s)"
     )
-    if args.final_tool != "none":
-        print(f"T_opt   = {t_opt:.2f}s ({args.final_tool})")
+    if cfg.final_tool != "none":
+        print(f"T_opt   = {t_opt:.2f}s ({cfg.final_tool})")
     else:
         print("T_opt   = 0.00s (no final tool)")
     print(f"T_total = {t_total:.2f}s")
     print("Pipeline finished successfully.")
 
-    stats_path = Path(args.stats_csv).resolve() if args.stats_csv else out_dir / f"{stem}_stats.csv"
-    stats_headers = [
-        "timestamp",
-        "input_blif",
-        "output_dir",
-        "objective",
-        "cut_size",
-            "final_tool",
-            "cuts_json",
-            "chosen_json",
-            "rebuilt_blif",
-            "cp_sat_status",
-            "cp_sat_objective",
-            "cut_enum_time_s",
-            "cp_sat_time_s",
-            "rebuild_time_s",
-            "final_time_s",
-            "t_pre_s",
-        "t_total_s",
-    ]
+    return _stats_result(cfg, run_timestamp, input_blif, out_dir, stem, cuts_json, chosen_json,
+                         rebuilt_blif, cp_sat_result, stage_times, final_time, t_pre, t_total)
+
+
+def _stats_result(cfg, run_timestamp, input_blif, out_dir, stem, cuts_json, chosen_json,
+                  rebuilt_blif, cp_sat_result, stage_times, final_time, t_pre, t_total):
+    """Build the (stats_path, summary_path, headers, row) result tuple.
+
+    Shared by the halted-after-CP-SAT and full-pipeline paths so the row
+    layout cannot drift between them.
+    """
+    stats_path = Path(cfg.stats_csv).resolve() if cfg.stats_csv else out_dir / f"{stem}_stats.csv"
+    summary_path = Path(cfg.summary_csv).resolve() if cfg.summary_csv else out_dir / "summary_stats.csv"
     stats_row = {
-        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "timestamp": run_timestamp,
         "input_blif": str(input_blif),
         "output_dir": str(out_dir),
-        "objective": args.objective,
-        "cut_size": args.cut_size if args.cut_size is not None else "",
-        "final_tool": args.final_tool,
+        "objective": cfg.objective,
+        "cut_size": cfg.cut_size if cfg.cut_size is not None else "",
+        "final_tool": cfg.final_tool,
         "cuts_json": str(cuts_json),
         "chosen_json": str(chosen_json),
         "rebuilt_blif": str(rebuilt_blif),
@@ -241,34 +493,105 @@ def _run_single_pipeline(args):
         "t_pre_s": f"{t_pre:.4f}",
         "t_total_s": f"{t_total:.4f}",
     }
-    _append_stats_row(stats_path, stats_headers, stats_row)
-    print(f"Stats appended to {stats_path}")
-    summary_path = Path(args.summary_csv).resolve() if args.summary_csv else out_dir / "summary_stats.csv"
-    _append_stats_row(summary_path, stats_headers, stats_row)
-    print(f"Summary appended to {summary_path}")
+    return stats_path, summary_path, STATS_HEADERS, stats_row
+
+
+def _init_worker():
+    """Warm up pool workers before the first job.
+
+    Importing main_cpsat pulls in the ortools native library, so each
+    long-lived worker pays the cold-start once instead of on its first
+    BLIF; subsequent files in the batch reuse the warm interpreter.
+    """
+    import main_cpsat  # noqa: F401
+
+
+def run_pipeline(cfg):
+    # One appender per distinct CSV, opened lazily on first row and held
+    # open for the whole run (the per-file stats path varies by stem, the
+    # summary path is shared).
+    appenders = {}
+    stack = contextlib.ExitStack()
+
+    def _appender_for(path, headers):
+        key = str(path)
+        appender = appenders.get(key)
+        if appender is None:
+            appender = stack.enter_context(StatsAppender(path, headers))
+            appenders[key] = appender
+        return appender
+
+    def _emit_stats(result):
+        if not result:
+            return
+        stats_path, summary_path, stats_headers, stats_row = result
+        _appender_for(stats_path, stats_headers).append(stats_row)
+        print(f"Stats appended to {stats_path}")
+        _appender_for(summary_path, stats_headers).append(stats_row)
+        print(f"Summary appended to {summary_path}")
 
+    with stack:
+        _run_pipeline_inner(cfg, _emit_stats)
 
-def run_pipeline(args):
-    input_path = Path(args.input_blif).resolve()
+
+def _run_pipeline_inner(cfg, _emit_stats):
+    input_path = Path(cfg.input_blif).resolve()
     if input_path.is_dir():
-        blif_files = sorted(p for p in input_path.glob("*.blif") if p.is_file())
+        # scandir reuses d_type from getdents, so listing avoids the
+        # per-entry stat that glob + is_file pays on large directories.
+        blif_files = sorted(
+            Path(entry.path)
+            for entry in os.scandir(input_path)
+            if entry.name.endswith(".blif") and entry.is_file(follow_symlinks=False)
+        )
         if not blif_files:
             raise FileNotFoundError(f"No BLIF files found in directory '{input_path}'")
         print(f"Found {len(blif_files)} BLIF files in {input_path}")
-        for blif in blif_files:
-            print(f"\n=== Processing {blif.name} ===")
-            file_args = argparse.Namespace(**vars(args))
-            file_args.input_blif = str(blif)
-            _run_single_pipeline(file_args)
+        # Pre-flight both stage binaries once: a misconfigured
+        # --rebuild-bin should fail here, not after the first file has
+        # already paid for cut enumeration and a CP-SAT solve. Pinning
+        # the resolved paths on the config also spares every worker the
+        # candidate probing.
+        cut_enum_bin, rebuild_bin = _resolve_stage_binaries(cfg, input_path)
+        cfg = dataclasses.replace(cfg, cut_enum_bin=cut_enum_bin, rebuild_bin=rebuild_bin)
+        jobs = cfg.jobs or min(len(blif_files), os.cpu_count() or 1)
+        if jobs > 1:
+            # Longest-processing-time-first: start the big netlists (file
+            # size is a fair proxy for solve time) before the small ones,
+            # so no giant straggler runs alone at the end of the batch.
+            blif_files.sort(key=lambda p: p.stat().st_size, reverse=True)
+        workers_each = cfg.cp_sat_workers
+        if jobs > 1 and workers_each is None:
+            # Split cores between concurrent pipelines and each pipeline's
+            # CP-SAT portfolio so the batch does not oversubscribe.
+            workers_each = max(1, (os.cpu_count() or 1) // jobs)
+        file_cfgs = [
+            dataclasses.replace(cfg, input_blif=str(blif), cp_sat_workers=workers_each)
+            for blif in blif_files
+        ]
+        if jobs > 1:
+            # Each BLIF only touches its own stem-based outputs, so the
+            # pipelines are independent; fan them out over a process pool.
+            # CSV appends happen in the parent as results arrive so rows
+            # from concurrent pipelines never interleave.
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_worker
+            ) as executor:
+                for result in executor.map(_run_single_pipeline, file_cfgs):
+                    _emit_stats(result)
+        else:
+            for file_cfg in file_cfgs:
+                print(f"\n=== Processing {Path(file_cfg.input_blif).name} ===")
+                _emit_stats(_run_single_pipeline(file_cfg))
         return
 
-    _run_single_pipeline(args)
+    _emit_stats(_run_single_pipeline(cfg))
 
 
 def main(argv=None):
     parser = argparse.ArgumentParser(description="Full BLIF->CP-SAT->rebuild pipeline")
     parser.add_argument("input_blif", help="Original BLIF file to process")
-    parser.add_argument("--objective", default="og", choices=["og", "inv", "area", "depth", "overall"], help="CP-SAT objective")
+    parser.add_argument("--objective", default="og", type=_objective_arg, help="CP-SAT objective, or a comma-separated sweep (e.g. og,area,depth); the first mode's selection feeds the rebuild")
     parser.add_argument("--cut-size", type=int, default=None, help="Optional K passed to cut_enumeration")
     parser.add_argument("--output-dir", default=None, help="Directory for generated artifacts (defaults to BLIF dir)")
     parser.add_argument("--output-stem", default=None, help="Base name for generated files")
@@ -284,9 +607,16 @@ def main(argv=None):
     parser.add_argument("--final-base", default=None, help="(unused) kept for backward compat")
     parser.add_argument("--stats-csv", default=None, help="CSV file to append pipeline stats (default: <output_dir>/<stem>_stats.csv)")
     parser.add_argument("--summary-csv", default=None, help="CSV file to append combined stats for all runs (default: <output_dir>/summary_stats.csv)")
+    parser.add_argument("--jobs", type=int, default=None, help="Parallel pipelines in directory mode (default: one per core, capped at the file count)")
+    parser.add_argument("--cp-sat-workers", type=int, default=None, help="CP-SAT search workers per solve (default: solver heuristic; in directory mode, cores divided by --jobs)")
+    parser.add_argument("--cache-dir", default=None, help="Directory for content-hash stage caching (default: <output_dir>/.flowcache)")
+    parser.add_argument("--no-cache", action="store_true", help="Disable content-hash caching of cut enumeration and rebuild outputs")
+    parser.add_argument("--force", action="store_true", help="Rerun every stage, bypassing both the mtime skips and the content cache")
+    parser.add_argument("--cuts-format", choices=["json", "msgpack"], default="json", help="On-disk cuts format; msgpack needs a cut_enumeration build that supports --format=msgpack and the msgspec package")
+    parser.add_argument("--stream-cuts", action="store_true", help="Tee cut_enumeration output to cuts_json while feeding the solver in memory (needs a build that writes its output file sequentially)")
     args = parser.parse_args(argv)
 
-    run_pipeline(args)
+    run_pipeline(PipelineConfig.from_args(args))
 
 
 if __name__ == "__main__":